@@ -0,0 +1,316 @@
+"""
+Local load-testing harness for the sentiment dashboard API.
+
+Starts app.py on a local werkzeug server in a separate process (or targets
+an already running server via --url) and replays dashboard sessions from
+several concurrent analysts, then reports throughput and p50/p95/p99
+latency per route.
+
+Usage:
+    python loadtest.py --concurrency 20 --requests 2000
+    python loadtest.py --url http://127.0.0.1:5000 --duration 30
+"""
+
+import argparse
+import http.client
+import logging
+import math
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlencode, urlsplit
+
+# ==============================================
+# 🔹 Traffic Mix
+# ==============================================
+# One dashboard session: an analyst picks a vehicle/sentiment filter and
+# every panel is fetched with it, so each filter choice fans out to all
+# of these routes.
+DASHBOARD_ROUTES = [
+    "/sentiment",
+    "/features",
+    "/competitors",
+    "/ratings",
+    "/filter",
+    "/recommendations",
+    "/summary",
+]
+
+# None means the filter is left unset ("All" in the dashboard dropdowns).
+VEHICLES = [None, "Harrier", "Safari"]
+SENTIMENTS = [None, "Positive", "Negative", "Neutral"]
+
+
+def build_session(rng):
+    """Pick random filters and return the (route, path) pairs they load."""
+    params = {}
+    vehicle = rng.choice(VEHICLES)
+    sentiment = rng.choice(SENTIMENTS)
+    if vehicle:
+        params["vehicle"] = vehicle
+    if sentiment:
+        params["sentiment"] = sentiment
+    query = "?" + urlencode(params) if params else ""
+    return [(route, route + query) for route in DASHBOARD_ROUTES]
+
+
+def parse_target(base_url):
+    """Split base_url into (connection class, host, port, path prefix)."""
+    target = urlsplit(base_url)
+    if target.scheme == "http":
+        conn_cls = http.client.HTTPConnection
+    elif target.scheme == "https":
+        conn_cls = http.client.HTTPSConnection
+    else:
+        raise ValueError(f"Unsupported URL scheme in {base_url!r}; use http:// or https://")
+    if not target.hostname:
+        raise ValueError(f"No host in {base_url!r}")
+    return conn_cls, target.hostname, target.port or conn_cls.default_port, target.path.rstrip("/")
+
+
+# ==============================================
+# 🖥️ Local Server
+# ==============================================
+def _serve(conn, threaded):
+    """Child process: load app.py from this directory and serve it."""
+    # analysis.py and recommender.py read the dataset by relative path
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        from werkzeug.serving import make_server
+        import analysis
+        from app import app
+
+        if analysis.df.empty:
+            raise RuntimeError(f"Dataset {analysis.DATA_PATH} is missing or empty")
+        # Per-request access logging would be timed as part of every response
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)
+        server = make_server("127.0.0.1", 0, app, threaded=threaded)
+    except Exception as exc:
+        conn.send(("error", str(exc)))
+        return
+    conn.send(("ready", server.server_port))
+    server.serve_forever()
+
+
+def start_local_server(threaded=True, startup_timeout=60):
+    """
+    Serve app.py on a free localhost port in a separate process, so the
+    server's pandas work does not share a GIL with the load generator.
+    """
+    parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+    proc = multiprocessing.Process(target=_serve, args=(child_conn, threaded), daemon=True)
+    proc.start()
+    child_conn.close()
+
+    deadline = time.monotonic() + startup_timeout
+    while not parent_conn.poll(0.1):
+        if not proc.is_alive():
+            raise RuntimeError("Local server exited during startup")
+        if time.monotonic() >= deadline:
+            proc.terminate()
+            raise RuntimeError(f"Local server not ready after {startup_timeout}s")
+    status, value = parent_conn.recv()
+    if status != "ready":
+        proc.join()
+        raise RuntimeError(f"Local server failed to start: {value}")
+    return proc, f"http://127.0.0.1:{value}"
+
+
+# ==============================================
+# 🚦 Load Generator
+# ==============================================
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_load(base_url, concurrency=10, total_requests=1000, duration=None,
+             warmup=20, timeout=30, seed=None):
+    """
+    Replay dashboard sessions against base_url, one analyst per worker.
+
+    Stops after total_requests, or after duration seconds when given.
+    Returns (latencies, errors, elapsed) where latencies maps each route
+    to a list of successful response times in seconds.
+    """
+    conn_cls, host, port, prefix = parse_target(base_url)
+
+    def fetch(path):
+        conn = conn_cls(host, port, timeout=timeout)
+        try:
+            conn.request("GET", prefix + path)
+            resp = conn.getresponse()
+            resp.read()
+            return resp.status
+        finally:
+            conn.close()
+
+    # Warm up caches and lazy imports so they don't skew the first samples
+    warm_rng = random.Random(seed)
+    warm_failed = 0
+    for i in range(warmup):
+        path = build_session(warm_rng)[i % len(DASHBOARD_ROUTES)][1]
+        try:
+            if fetch(path) != 200:
+                warm_failed += 1
+        except (OSError, http.client.HTTPException) as exc:
+            raise SystemExit(f"❌ Target {base_url} is unreachable: {exc}")
+    if warm_failed:
+        print(f"⚠️ Warning: {warm_failed} of {warmup} warmup requests failed.")
+
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    lock = threading.Lock()
+    issued = [0]
+    deadline = time.perf_counter() + duration if duration is not None else None
+
+    def next_slot():
+        with lock:
+            if deadline is None and issued[0] >= total_requests:
+                return False
+            issued[0] += 1
+            return True
+
+    def worker(worker_id):
+        rng = random.Random(None if seed is None else seed + worker_id + 1)
+        while True:
+            for route, path in build_session(rng):
+                if not next_slot():
+                    return
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return
+                start = time.perf_counter()
+                try:
+                    ok = fetch(path) == 200
+                except (OSError, http.client.HTTPException):
+                    ok = False
+                elapsed = time.perf_counter() - start
+                with lock:
+                    if ok:
+                        latencies[route].append(elapsed)
+                    else:
+                        errors[route] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies, errors, time.perf_counter() - started
+
+
+# ==============================================
+# 📊 Report
+# ==============================================
+def format_report(latencies, errors, elapsed, concurrency):
+    """Render throughput and per-route latency percentiles as a table."""
+    routes = sorted(set(latencies) | set(errors))
+    all_samples = sorted(s for samples in latencies.values() for s in samples)
+    total_ok = len(all_samples)
+    total_err = sum(errors.values())
+
+    lines = [
+        f"Concurrency: {concurrency}  Elapsed: {elapsed:.2f}s  "
+        f"Requests: {total_ok + total_err}  Errors: {total_err}",
+        f"Throughput: {total_ok / elapsed if elapsed else 0:.1f} req/s",
+        "",
+        f"{'route':<18}{'count':>7}{'errors':>8}{'req/s':>9}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}",
+    ]
+
+    def ms(samples, pct):
+        # A route with no successful samples must not look instant
+        return f"{percentile(samples, pct) * 1000:>9.1f}" if samples else f"{'-':>9}"
+
+    def row(name, samples, err):
+        samples = sorted(samples)
+        return (
+            f"{name:<18}{len(samples):>7}{err:>8}"
+            f"{len(samples) / elapsed if elapsed else 0:>9.1f}"
+            f"{ms(samples, 50)}{ms(samples, 95)}{ms(samples, 99)}"
+        )
+
+    for route in routes:
+        lines.append(row(route, latencies.get(route, []), errors.get(route, 0)))
+    lines.append(row("ALL", all_samples, total_err))
+    return "\n".join(lines)
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def positive_float(value):
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {number}")
+    return number
+
+
+def non_negative_int(value):
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be at least 0, got {number}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay dashboard traffic and report latency.")
+    parser.add_argument("--url", help="Target an already running server instead of starting app.py locally.")
+    parser.add_argument("--concurrency", type=positive_int, default=10,
+                        help="Number of concurrent analysts, each replaying dashboard sessions.")
+    parser.add_argument("--requests", type=positive_int, default=1000, help="Total requests to send.")
+    parser.add_argument("--duration", type=positive_float, help="Run for this many seconds instead of a fixed request count.")
+    parser.add_argument("--warmup", type=non_negative_int, default=20, help="Untimed requests sent before measuring.")
+    parser.add_argument("--timeout", type=positive_float, default=30, help="Per-request timeout in seconds.")
+    parser.add_argument("--seed", type=int, help="Seed for a reproducible request mix.")
+    parser.add_argument("--single-threaded", action="store_true",
+                        help="Serve the local app with one thread to compare serving configurations.")
+    args = parser.parse_args()
+
+    if args.url:
+        try:
+            parse_target(args.url)
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    server = None
+    base_url = args.url
+    if not base_url:
+        try:
+            server, base_url = start_local_server(threaded=not args.single_threaded)
+        except RuntimeError as exc:
+            sys.exit(f"❌ {exc}")
+        print(f"🚗 Serving app.py locally → {base_url}")
+
+    try:
+        latencies, errors, elapsed = run_load(
+            base_url,
+            concurrency=args.concurrency,
+            total_requests=args.requests,
+            duration=args.duration,
+            warmup=args.warmup,
+            timeout=args.timeout,
+            seed=args.seed,
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+
+    print(format_report(latencies, errors, elapsed, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()